@@ -5,18 +5,30 @@ FastAPI backend that exposes Semantic Kernel functionality with real APIs.
 """
 
 import asyncio
+import functools
+import hashlib
 import os
-import json
+import ssl
+import sys
+import time
 from datetime import datetime, timedelta
 from typing import Annotated, Optional
 from contextlib import asynccontextmanager
+from urllib.parse import quote
+from zoneinfo import ZoneInfo
 
+import certifi
 import httpx
-from fastapi import FastAPI, HTTPException
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from cachetools import TTLCache
 from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -28,6 +40,176 @@ from dotenv import load_dotenv
 from azure.identity import AzureCliCredential, get_bearer_token_provider
 
 
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Load .env from code-samples directory if not found locally
+load_dotenv()
+if not os.getenv("AZURE_OPENAI_ENDPOINT"):
+    # Try loading from code-samples directory (two levels up from backend)
+    load_dotenv(os.path.join(os.path.dirname(__file__), "..", "..", "code-samples", ".env"))
+
+AZURE_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
+AZURE_MODEL = os.getenv("AZURE_OPENAI_CHAT_COMPLETION_MODEL")
+AZURE_TENANT_ID = os.getenv("AZURE_TENANT_ID")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Comma-separated frontend origins allowed to call the API
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
+    if origin.strip()
+]
+
+# Built once at import: creating a default context re-reads the CA bundle
+# from disk, which is the dominant cost of standing up an httpx client.
+# Uses certifi's bundle so trust matches httpx's own default.
+_SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# How long an entry is kept past its TTL so it can still be revalidated
+_REVALIDATE_WINDOW = 24 * 3600
+
+# In-process L1 in front of Redis (L2), bounded to cap memory. Values carry
+# their own expiry so shorter per-endpoint TTLs still apply; the cache's own
+# TTL is only an upper bound.
+_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+
+def _remember(key: str, value, ttl: float) -> None:
+    """Keep ``value`` in the in-process cache for up to ``ttl`` seconds."""
+    _CACHE[key] = (time.time() + ttl, value)
+
+
+async def _cache_get(redis_client: Redis, key: str):
+    """Return the cached value for ``key``, or ``None`` on a miss.
+
+    The in-process cache is checked before Redis, and Redis hits are copied
+    into it for their remaining TTL. Redis errors propagate so callers can
+    stop using Redis for the rest of the call.
+    """
+    local = _CACHE.get(key)
+    if local is not None and local[0] > time.time():
+        return local[1]
+    
+    async with redis_client.pipeline(transaction=False) as pipe:
+        hit, ttl_ms = await pipe.get(key).pttl(key).execute()
+    if hit is None:
+        return None
+    value = orjson.loads(hit)
+    if ttl_ms > 0:
+        _remember(key, value, ttl_ms / 1000)
+    return value
+
+
+async def _cache_set(redis_client: Optional[Redis], key: str, value, ttl: int) -> None:
+    """Store ``value`` under ``key`` for ``ttl`` seconds in both cache tiers.
+
+    Pass ``redis_client=None`` to only keep the in-process copy. Redis errors
+    are ignored.
+    """
+    _remember(key, value, ttl)
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, orjson.dumps(value), ex=ttl)
+    except RedisError:
+        pass
+
+
+def cached(prefix: str, ttl: int):
+    """Cache an async plugin fetch in memory and Redis for ``ttl`` seconds.
+
+    The key is a hash of the function name and its arguments. If Redis is
+    unreachable only the in-process cache is used, and exceptions raised by
+    the wrapped function are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key_source = repr((func.__qualname__, args, sorted(kwargs.items())))
+            key = f"assistant:{prefix}:{hashlib.sha256(key_source.encode()).hexdigest()}"
+            redis_client = self._redis
+            try:
+                hit = await _cache_get(redis_client, key)
+            except RedisError:
+                hit, redis_client = None, None
+            if hit is not None:
+                return hit
+            
+            result = await func(self, *args, **kwargs)
+            await _cache_set(redis_client, key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+async def revalidated_get_json(
+    client: httpx.AsyncClient,
+    redis_client: Redis,
+    url: httpx.URL,
+    ttl: int,
+    params: Optional[dict] = None,
+):
+    """``get_json`` backed by a cache entry that is revalidated by ETag.
+
+    Fresh entries are returned directly. Once stale, the stored ETag is sent
+    as ``If-None-Match`` and a 304 renews the entry without re-downloading
+    the body. Entries are kept for ``_REVALIDATE_WINDOW`` past their TTL.
+    """
+    request = client.build_request("GET", url, params=params)
+    key = f"assistant:http:{hashlib.sha256(str(request.url).encode()).hexdigest()}"
+    try:
+        entry = await _cache_get(redis_client, key)
+    except RedisError:
+        entry, redis_client = None, None
+    
+    now = time.time()
+    if entry is not None:
+        if entry["fresh_until"] > now:
+            return entry["data"]
+        if entry["etag"]:
+            request.headers["If-None-Match"] = entry["etag"]
+    
+    response = await client.send(request)
+    if response.status_code == 304 and entry is not None:
+        data, etag = entry["data"], entry["etag"]
+    else:
+        if not response.is_success:
+            response.raise_for_status()
+        data, etag = orjson.loads(response.content), response.headers.get("ETag")
+    
+    entry = {"data": data, "etag": etag, "fresh_until": now + ttl}
+    await _cache_set(redis_client, key, entry, ttl + _REVALIDATE_WINDOW)
+    return data
+
+
+# ============================================================================
+# HTTP HELPERS
+# ============================================================================
+
+@functools.lru_cache(maxsize=1024)
+def _path_segment(value: str) -> str:
+    """Percent-encode ``value`` as a single URL path segment."""
+    return quote(value, safe="")
+
+
+async def get_json(client: httpx.AsyncClient, url: httpx.URL, params: Optional[dict] = None):
+    """GET ``url`` and decode the body straight from the response bytes.
+
+    Non-2xx responses raise ``httpx.HTTPStatusError`` as ``raise_for_status``
+    would; the status check is skipped entirely on the success path.
+    """
+    response = await client.get(url, params=params)
+    if not response.is_success:
+        response.raise_for_status()
+    return orjson.loads(response.content)
+
+
 # ============================================================================
 # PLUGINS WITH REAL APIs
 # ============================================================================
@@ -35,20 +217,27 @@ from azure.identity import AzureCliCredential, get_bearer_token_provider
 class WeatherPlugin:
     """Real weather data from wttr.in API."""
     
+    _BASE_URL = httpx.URL("https://wttr.in")
+    
+    def __init__(self, http_client: httpx.AsyncClient, redis_client: Redis):
+        self._http = http_client
+        self._redis = redis_client
+    
+    @cached("weather", ttl=300)
+    async def _fetch(self, city: str) -> dict:
+        url = self._BASE_URL.copy_with(path=f"/{_path_segment(city)}")
+        return await get_json(self._http, url, params={"format": "j1"})
+    
     @kernel_function(
         name="GetCurrentWeather",
         description="Get the current REAL weather for any city in the world."
     )
-    def get_current_weather(
+    async def get_current_weather(
         self,
         city: Annotated[str, "The name of the city to get weather for"]
     ) -> str:
         try:
-            url = f"https://wttr.in/{city}?format=j1"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch(city)
             
             current = data["current_condition"][0]
             location = data["nearest_area"][0]
@@ -78,16 +267,12 @@ class WeatherPlugin:
         name="GetWeatherForecast",
         description="Get a 3-day weather forecast for any city."
     )
-    def get_weather_forecast(
+    async def get_weather_forecast(
         self,
         city: Annotated[str, "The name of the city to get forecast for"]
     ) -> str:
         try:
-            url = f"https://wttr.in/{city}?format=j1"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch(city)
             
             forecast_data = data["weather"]
             location = data["nearest_area"][0]
@@ -114,11 +299,26 @@ class WeatherPlugin:
 class CurrencyPlugin:
     """Real currency exchange rates from frankfurter.app."""
     
+    _LATEST_URL = httpx.URL("https://api.frankfurter.app/latest")
+    
+    def __init__(self, http_client: httpx.AsyncClient, redis_client: Redis):
+        self._http = http_client
+        self._redis = redis_client
+    
+    @cached("currency", ttl=300)
+    async def _fetch_conversion(self, amount: float, from_curr: str, to_curr: str) -> dict:
+        params = {"amount": amount, "from": from_curr, "to": to_curr}
+        return await get_json(self._http, self._LATEST_URL, params=params)
+    
+    async def _fetch_rates(self, base: str, targets: str) -> dict:
+        params = {"from": base, "to": targets}
+        return await revalidated_get_json(self._http, self._redis, self._LATEST_URL, ttl=300, params=params)
+    
     @kernel_function(
         name="ConvertCurrency",
         description="Convert between currencies using REAL live exchange rates."
     )
-    def convert_currency(
+    async def convert_currency(
         self,
         amount: Annotated[float, "Amount to convert"],
         from_currency: Annotated[str, "Source currency code (e.g., USD, EUR, GBP, JPY)"],
@@ -128,11 +328,7 @@ class CurrencyPlugin:
             from_curr = from_currency.upper()
             to_curr = to_currency.upper()
             
-            url = f"https://api.frankfurter.app/latest?amount={amount}&from={from_curr}&to={to_curr}"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch_conversion(amount, from_curr, to_curr)
             
             converted = data["rates"][to_curr]
             rate = converted / amount
@@ -146,7 +342,7 @@ class CurrencyPlugin:
         name="GetExchangeRates",
         description="Get current exchange rates for a base currency."
     )
-    def get_exchange_rates(
+    async def get_exchange_rates(
         self,
         base_currency: Annotated[str, "Base currency code (e.g., USD, EUR)"],
         target_currencies: Annotated[str, "Comma-separated target currencies"] = "EUR,GBP,JPY,INR,AUD,CAD"
@@ -155,11 +351,7 @@ class CurrencyPlugin:
             base = base_currency.upper()
             targets = target_currencies.upper()
             
-            url = f"https://api.frankfurter.app/latest?from={base}&to={targets}"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch_rates(base, targets)
             
             result = f"📊 Exchange Rates for 1 {base} (as of {data['date']}):\n"
             for currency, rate in data["rates"].items():
@@ -171,7 +363,7 @@ class CurrencyPlugin:
 
 
 class WorldTimePlugin:
-    """Real world time data from worldtimeapi.org."""
+    """Current local time in major cities, computed with zoneinfo."""
     
     TIMEZONE_MAP = {
         "new york": "America/New_York",
@@ -199,44 +391,41 @@ class WorldTimePlugin:
         city: Annotated[str, "City name (e.g., 'Tokyo', 'New York', 'London')"]
     ) -> str:
         try:
-            city_lower = city.lower()
-            timezone = self.TIMEZONE_MAP.get(city_lower)
+            timezone = self.TIMEZONE_MAP.get(city.lower())
             
             if not timezone:
                 return f"Timezone not found for {city}. Try: New York, London, Tokyo, Paris, Sydney, Dubai, Mumbai"
             
-            url = f"http://worldtimeapi.org/api/timezone/{timezone}"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
-            
-            datetime_str = data["datetime"]
-            utc_offset = data["utc_offset"]
-            
-            dt = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-            formatted_time = dt.strftime("%I:%M:%S %p")
-            formatted_date = dt.strftime("%A, %B %d, %Y")
+            now = datetime.now(ZoneInfo(timezone))
+            formatted_time = now.strftime("%I:%M:%S %p")
+            formatted_date = now.strftime("%A, %B %d, %Y")
+            offset = now.strftime("%z")
+            utc_offset = f"{offset[:3]}:{offset[3:]}"
             
             return f"🕐 {city.title()}: {formatted_time}\n📅 {formatted_date}\n🌐 UTC Offset: {utc_offset}"
         except Exception as e:
-            return f"Could not fetch time for {city}: {str(e)}"
+            return f"Could not get time for {city}: {str(e)}"
 
 
 class QuotesPlugin:
     """Inspirational quotes from zenquotes.io API."""
     
+    _RANDOM_URL = httpx.URL("https://zenquotes.io/api/random")
+    
+    def __init__(self, http_client: httpx.AsyncClient, redis_client: Redis):
+        self._http = http_client
+        self._redis = redis_client
+    
+    async def _fetch_random(self) -> list:
+        return await get_json(self._http, self._RANDOM_URL)
+    
     @kernel_function(
         name="GetRandomQuote",
         description="Get a random inspirational quote."
     )
-    def get_random_quote(self) -> str:
+    async def get_random_quote(self) -> str:
         try:
-            url = "https://zenquotes.io/api/random"
-            with httpx.Client(timeout=10.0, verify=True) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch_random()
             
             # zenquotes returns a list with one quote object
             quote_obj = data[0] if isinstance(data, list) else data
@@ -251,28 +440,38 @@ class QuotesPlugin:
         name="GetQuoteByTag",
         description="Get a motivational or inspirational quote. Note: specific categories are not available, returns a random inspirational quote."
     )
-    def get_quote_by_tag(
+    async def get_quote_by_tag(
         self,
         tag: Annotated[str, "Quote category (returns random inspirational quote)"]
     ) -> str:
         # zenquotes doesn't support tags, so we get a random quote
-        return self.get_random_quote()
+        return await self.get_random_quote()
 
 
 class JokesPlugin:
     """Random jokes from Official Joke API."""
     
+    _RANDOM_URL = httpx.URL("https://official-joke-api.appspot.com/random_joke")
+    _PROGRAMMING_URL = httpx.URL("https://official-joke-api.appspot.com/jokes/programming/random")
+    
+    def __init__(self, http_client: httpx.AsyncClient, redis_client: Redis):
+        self._http = http_client
+        self._redis = redis_client
+    
+    async def _fetch_random(self) -> dict:
+        return await get_json(self._http, self._RANDOM_URL)
+    
+    async def _fetch_programming(self) -> dict:
+        jokes = await get_json(self._http, self._PROGRAMMING_URL)
+        return jokes[0]
+    
     @kernel_function(
         name="GetRandomJoke",
         description="Get a random joke."
     )
-    def get_random_joke(self) -> str:
+    async def get_random_joke(self) -> str:
         try:
-            url = "https://official-joke-api.appspot.com/random_joke"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch_random()
             
             return f"😄 {data['setup']}\n\n🎯 {data['punchline']}"
         except Exception as e:
@@ -282,13 +481,9 @@ class JokesPlugin:
         name="GetProgrammingJoke",
         description="Get a programming/tech joke."
     )
-    def get_programming_joke(self) -> str:
+    async def get_programming_joke(self) -> str:
         try:
-            url = "https://official-joke-api.appspot.com/jokes/programming/random"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()[0]
+            data = await self._fetch_programming()
             
             return f"💻 {data['setup']}\n\n🎯 {data['punchline']}"
         except Exception as e:
@@ -298,20 +493,27 @@ class JokesPlugin:
 class WikipediaPlugin:
     """Quick facts from Wikipedia API."""
     
+    _SUMMARY_URL = httpx.URL("https://en.wikipedia.org/api/rest_v1/page/summary/")
+    
+    def __init__(self, http_client: httpx.AsyncClient, redis_client: Redis):
+        self._http = http_client
+        self._redis = redis_client
+    
+    async def _fetch_summary(self, topic: str) -> dict:
+        title = _path_segment(topic.replace(" ", "_"))
+        url = self._SUMMARY_URL.copy_with(path=self._SUMMARY_URL.path + title)
+        return await revalidated_get_json(self._http, self._redis, url, ttl=3600)
+    
     @kernel_function(
         name="GetWikipediaSummary",
         description="Get a quick summary about any topic from Wikipedia."
     )
-    def get_summary(
+    async def get_summary(
         self,
         topic: Annotated[str, "The topic to look up"]
     ) -> str:
         try:
-            url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{topic.replace(' ', '_')}"
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._fetch_summary(topic)
             
             title = data.get("title", topic)
             extract = data.get("extract", "No summary available.")
@@ -324,6 +526,20 @@ class WikipediaPlugin:
             return f"Could not fetch Wikipedia summary for '{topic}': {str(e)}"
 
 
+def calculate_loan_schedule(principal: float, rates: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Monthly payment for each (annual rate %, term in years) pair.
+
+    ``rates`` and ``years`` broadcast against each other, so a whole grid of
+    loan options is priced in one vectorized pass.
+    """
+    monthly_rate = np.asarray(rates, dtype=float) / 100 / 12
+    num_payments = np.asarray(years, dtype=float) * 12
+    growth = (1 + monthly_rate) ** num_payments
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amortized = principal * (monthly_rate * growth) / (growth - 1)
+        return np.where(monthly_rate == 0, principal / num_payments, amortized)
+
+
 class FinancePlugin:
     """Financial calculation utilities."""
     
@@ -408,22 +624,72 @@ class FinancePlugin:
             f"💰 Total to Pay: ${total_paid:,.2f}\n"
             f"📈 Total Interest: ${total_interest:,.2f}"
         )
+    
+    @kernel_function(
+        name="CompareLoanOptions",
+        description="Compare monthly loan/mortgage payments across several terms and interest rates."
+    )
+    def compare_loan_options(
+        self,
+        principal: Annotated[float, "Loan amount"],
+        annual_rates: Annotated[str, "Comma-separated annual interest rates as percentages (e.g., '6.5' or '5.5,6,6.5')"],
+        years: Annotated[str, "Comma-separated loan terms in years (e.g., '15,20,30')"]
+    ) -> str:
+        try:
+            rate_options = np.array([float(r) for r in annual_rates.split(",")])
+            term_options = np.array([int(y) for y in years.split(",")])
+        except ValueError:
+            return "❌ Rates and terms must be comma-separated numbers"
+        
+        if principal <= 0:
+            return "❌ Loan amount must be greater than zero"
+        if (term_options <= 0).any():
+            return "❌ Loan terms must be at least one year"
+        
+        # Every rate paired with every term
+        rate_grid, term_grid = np.meshgrid(rate_options, term_options)
+        rate_grid, term_grid = rate_grid.ravel(), term_grid.ravel()
+        payments = calculate_loan_schedule(principal, rate_grid, term_grid)
+        total_interest = payments * term_grid * 12 - principal
+        
+        result = f"🏠 Loan Comparison for ${principal:,.2f}\n"
+        for rate, term, payment, interest in zip(rate_grid, term_grid, payments, total_interest):
+            result += f"  • {term} years @ {rate}%: ${payment:,.2f}/month | Total interest: ${interest:,.2f}\n"
+        return result
 
 
 class TaskManagerPlugin:
     """Task management plugin."""
     
-    _tasks = []
+    # Tasks are keyed by ID; the index sets are kept in step by _insert and
+    # complete_task so lookups and filters never scan every task.
+    _tasks: dict[int, dict] = {}
+    _by_priority: dict[str, set[int]] = {}
+    _by_due: dict[str, set[int]] = {}
+    _pending: set[int] = set()
     _next_id = 1
     
     def __init__(self):
         if not TaskManagerPlugin._tasks:
-            TaskManagerPlugin._tasks = [
-                {"id": 1, "task": "Review quarterly report", "priority": "high", "due": "today", "done": False},
-                {"id": 2, "task": "Team standup meeting", "priority": "medium", "due": "today", "done": False},
-                {"id": 3, "task": "Update project documentation", "priority": "low", "due": "tomorrow", "done": False},
-            ]
-            TaskManagerPlugin._next_id = 4
+            self._insert("Review quarterly report", "high", "today")
+            self._insert("Team standup meeting", "medium", "today")
+            self._insert("Update project documentation", "low", "tomorrow")
+    
+    @classmethod
+    def _insert(cls, task: str, priority: str, due: str) -> dict:
+        new_task = {
+            "id": cls._next_id,
+            "task": task,
+            "priority": priority,
+            "due": due,
+            "done": False
+        }
+        cls._tasks[new_task["id"]] = new_task
+        cls._by_priority.setdefault(priority, set()).add(new_task["id"])
+        cls._by_due.setdefault(due, set()).add(new_task["id"])
+        cls._pending.add(new_task["id"])
+        cls._next_id += 1
+        return new_task
     
     @kernel_function(
         name="GetTasks",
@@ -433,16 +699,20 @@ class TaskManagerPlugin:
         self,
         filter_by: Annotated[str, "Filter: 'all', 'today', 'pending', 'done', 'high', 'medium', 'low'"] = "all"
     ) -> str:
-        tasks = TaskManagerPlugin._tasks
+        all_tasks = TaskManagerPlugin._tasks
         
         if filter_by == "today":
-            tasks = [t for t in tasks if t["due"] == "today"]
+            task_ids = TaskManagerPlugin._by_due.get("today", set())
         elif filter_by == "pending":
-            tasks = [t for t in tasks if not t["done"]]
+            task_ids = TaskManagerPlugin._pending
         elif filter_by == "done":
-            tasks = [t for t in tasks if t["done"]]
+            task_ids = all_tasks.keys() - TaskManagerPlugin._pending
         elif filter_by in ["high", "medium", "low"]:
-            tasks = [t for t in tasks if t["priority"] == filter_by]
+            task_ids = TaskManagerPlugin._by_priority.get(filter_by, set())
+        else:
+            task_ids = all_tasks.keys()
+        
+        tasks = [all_tasks[i] for i in sorted(task_ids)]
         
         if not tasks:
             return f"📋 No tasks found for filter: {filter_by}"
@@ -465,15 +735,7 @@ class TaskManagerPlugin:
         priority: Annotated[str, "Priority: high, medium, or low"] = "medium",
         due: Annotated[str, "Due date"] = "today"
     ) -> str:
-        new_task = {
-            "id": TaskManagerPlugin._next_id,
-            "task": task,
-            "priority": priority.lower(),
-            "due": due,
-            "done": False
-        }
-        TaskManagerPlugin._tasks.append(new_task)
-        TaskManagerPlugin._next_id += 1
+        new_task = TaskManagerPlugin._insert(task, priority.lower(), due)
         return f"✅ Task added: [{new_task['id']}] {task} (Priority: {priority}, Due: {due})"
     
     @kernel_function(
@@ -484,11 +746,12 @@ class TaskManagerPlugin:
         self,
         task_id: Annotated[int, "The ID of the task to complete"]
     ) -> str:
-        for t in TaskManagerPlugin._tasks:
-            if t["id"] == task_id:
-                t["done"] = True
-                return f"✅ Completed: {t['task']}"
-        return f"❌ Task with ID {task_id} not found"
+        t = TaskManagerPlugin._tasks.get(task_id)
+        if not t:
+            return f"❌ Task with ID {task_id} not found"
+        t["done"] = True
+        TaskManagerPlugin._pending.discard(task_id)
+        return f"✅ Completed: {t['task']}"
 
 
 # ============================================================================
@@ -497,37 +760,45 @@ class TaskManagerPlugin:
 
 kernel: Optional[Kernel] = None
 
-def create_kernel() -> Kernel:
-    """Create and configure the Semantic Kernel with all plugins."""
-    # Load .env from code-samples directory if not found locally
-    load_dotenv()
-    if not os.getenv("AZURE_OPENAI_ENDPOINT"):
-        # Try loading from code-samples directory (two levels up from backend)
-        code_samples_env = os.path.join(os.path.dirname(__file__), "..", "..", "code-samples", ".env")
-        load_dotenv(code_samples_env)
-    
+
+@functools.lru_cache(maxsize=1)
+def _get_token_provider(tenant_id: Optional[str]):
+    """Build the Azure AD token provider once per process.
+
+    The provider caches its token, so reusing it across kernel rebuilds
+    avoids spawning ``az`` to mint a new one each time.
+    """
+    credential = AzureCliCredential(tenant_id=tenant_id) if tenant_id else AzureCliCredential()
+    return get_bearer_token_provider(credential, "https://cognitiveservices.azure.com/.default")
+
+
+def create_kernel(http_client: httpx.AsyncClient, redis_client: Redis) -> Kernel:
+    """Create and configure the Semantic Kernel with all plugins.
+
+    Network-backed plugins share ``http_client`` so every tool call reuses
+    pooled keep-alive connections instead of opening a fresh one, and
+    cache upstream responses in ``redis_client``.
+    """
     k = Kernel()
     
-    tenant_id = os.getenv("AZURE_TENANT_ID")
-    credential = AzureCliCredential(tenant_id=tenant_id) if tenant_id else AzureCliCredential()
-    token_provider = get_bearer_token_provider(credential, "https://cognitiveservices.azure.com/.default")
+    token_provider = _get_token_provider(AZURE_TENANT_ID)
     
     k.add_service(
         AzureChatCompletion(
             service_id="default",
-            deployment_name=os.getenv("AZURE_OPENAI_CHAT_COMPLETION_MODEL"),
-            endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            deployment_name=AZURE_MODEL,
+            endpoint=AZURE_ENDPOINT,
             ad_token_provider=token_provider
         )
     )
     
     # Register all plugins
-    k.add_plugin(WeatherPlugin(), "Weather")
-    k.add_plugin(CurrencyPlugin(), "Currency")
+    k.add_plugin(WeatherPlugin(http_client, redis_client), "Weather")
+    k.add_plugin(CurrencyPlugin(http_client, redis_client), "Currency")
     k.add_plugin(WorldTimePlugin(), "WorldTime")
-    k.add_plugin(QuotesPlugin(), "Quotes")
-    k.add_plugin(JokesPlugin(), "Jokes")
-    k.add_plugin(WikipediaPlugin(), "Wikipedia")
+    k.add_plugin(QuotesPlugin(http_client, redis_client), "Quotes")
+    k.add_plugin(JokesPlugin(http_client, redis_client), "Jokes")
+    k.add_plugin(WikipediaPlugin(http_client, redis_client), "Wikipedia")
     k.add_plugin(FinancePlugin(), "Finance")
     k.add_plugin(TaskManagerPlugin(), "Tasks")
     
@@ -536,10 +807,29 @@ def create_kernel() -> Kernel:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize kernel on startup."""
+    """Initialize the shared HTTP and Redis clients and kernel on startup."""
     global kernel
-    kernel = create_kernel()
-    yield
+    # Connection settings live on the transport: the client ignores its own
+    # limits/http2/verify once a transport is supplied. retries=2 re-attempts
+    # failed connects only; plugins still handle terminal failures.
+    transport = httpx.AsyncHTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        http2=True,
+        verify=_SSL_CTX,
+    )
+    app.state.http = httpx.AsyncClient(transport=transport, timeout=10.0)
+    app.state.redis = Redis.from_url(
+        REDIS_URL,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+    )
+    kernel = create_kernel(app.state.http, app.state.redis)
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+        await app.state.redis.aclose()
 
 
 # ============================================================================
@@ -556,10 +846,10 @@ app = FastAPI(
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 
@@ -589,10 +879,9 @@ async def chat(request: ChatRequest):
         
         result = await kernel.invoke_prompt(request.message, arguments=arguments)
         
-        return ChatResponse(
-            response=str(result),
-            timestamp=datetime.now().isoformat()
-        )
+        # Encoded directly; ChatResponse still documents the shape in OpenAPI
+        body = {"response": str(result), "timestamp": datetime.now().isoformat()}
+        return Response(content=orjson.dumps(body), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -600,24 +889,35 @@ async def chat(request: ChatRequest):
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": datetime.now().isoformat(timespec="seconds")}
+
+
+_CAPABILITIES = {
+    "capabilities": [
+        {"name": "Weather", "icon": "🌤️", "description": "Live weather data for any city worldwide"},
+        {"name": "Currency", "icon": "💱", "description": "Real-time exchange rates"},
+        {"name": "World Time", "icon": "🕐", "description": "Current time in major cities"},
+        {"name": "Quotes", "icon": "💭", "description": "Inspirational quotes by category"},
+        {"name": "Jokes", "icon": "😄", "description": "Random jokes and programming humor"},
+        {"name": "Wikipedia", "icon": "📚", "description": "Quick facts about any topic"},
+        {"name": "Finance", "icon": "💰", "description": "Loans, investments, tips, bill splitting"},
+        {"name": "Tasks", "icon": "📋", "description": "Manage your todo list"},
+    ]
+}
+
+# The payload never changes, so it is serialized once at import and browsers
+# may keep it for an hour, revalidating with the ETag afterwards.
+_CAPABILITIES_JSON = orjson.dumps(_CAPABILITIES)
+_CAPABILITIES_ETAG = f'"{hashlib.sha256(_CAPABILITIES_JSON).hexdigest()[:16]}"'
+_CAPABILITIES_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _CAPABILITIES_ETAG}
 
 
 @app.get("/api/capabilities")
-async def get_capabilities():
+async def get_capabilities(request: Request):
     """Get list of available capabilities."""
-    return {
-        "capabilities": [
-            {"name": "Weather", "icon": "🌤️", "description": "Live weather data for any city worldwide"},
-            {"name": "Currency", "icon": "💱", "description": "Real-time exchange rates"},
-            {"name": "World Time", "icon": "🕐", "description": "Current time in major cities"},
-            {"name": "Quotes", "icon": "💭", "description": "Inspirational quotes by category"},
-            {"name": "Jokes", "icon": "😄", "description": "Random jokes and programming humor"},
-            {"name": "Wikipedia", "icon": "📚", "description": "Quick facts about any topic"},
-            {"name": "Finance", "icon": "💰", "description": "Loans, investments, tips, bill splitting"},
-            {"name": "Tasks", "icon": "📋", "description": "Manage your todo list"},
-        ]
-    }
+    if request.headers.get("if-none-match") == _CAPABILITIES_ETAG:
+        return Response(status_code=304, headers=_CAPABILITIES_HEADERS)
+    return Response(content=_CAPABILITIES_JSON, media_type="application/json", headers=_CAPABILITIES_HEADERS)
 
 
 # Serve static files
@@ -632,4 +932,6 @@ if os.path.exists(frontend_path):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop has no Windows build (uvicorn[standard] skips it there)
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http="httptools")